@@ -77,7 +77,7 @@ class AbstractInitialDesign:
 
         self._additional_configs = additional_configs
 
-        n_params = len(self._configspace.get_hyperparameters())
+        n_params = len(self._configspace)
         if n_configs is not None:
             logger.info("Using `n_configs` and ignoring `n_configs_per_hyperparameter`.")
             self._n_configs = n_configs
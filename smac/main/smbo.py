@@ -103,7 +103,7 @@ class SMBO:
     def remaining_walltime(self) -> float:
         """Subtracts the runtime configuration budget with the used wallclock time."""
         assert self._start_time is not None
-        return self._scenario.walltime_limit - (time.time() - self._start_time)
+        return self._scenario.walltime_limit - (time.perf_counter() - self._start_time)
 
     @property
     def remaining_cputime(self) -> float:
@@ -130,7 +130,7 @@ class SMBO:
         if self._start_time is None:
             return 0.0
 
-        return time.time() - self._start_time
+        return time.perf_counter() - self._start_time
 
     @property
     def used_target_function_walltime(self) -> float:
@@ -277,7 +277,7 @@ class SMBO:
         # Start the timer before we do anything
         # If we continue the optimization, the starting time is set by the load method
         if self._start_time is None:
-            self._start_time = time.time()
+            self._start_time = time.perf_counter()
 
         for callback in self._callbacks:
             callback.on_start(self)
@@ -399,7 +399,7 @@ class SMBO:
 
             self._used_target_function_walltime = data["used_target_function_walltime"]
             self._finished = data["finished"]
-            self._start_time = time.time() - data["used_walltime"]
+            self._start_time = time.perf_counter() - data["used_walltime"]
 
     def save(self) -> None:
         """Saves the current stats, runhistory, and intensifier."""
@@ -68,7 +68,7 @@ class AbstractRunHistoryEncoder:
         self._instances = scenario.instances
         self._instance_features = scenario.instance_features
         self._n_features = scenario.count_instance_features()
-        self._n_params = len(scenario.configspace.get_hyperparameters())
+        self._n_params = len(scenario.configspace)
 
         if self._instances is not None and self._n_features == 0:
             logger.warning(
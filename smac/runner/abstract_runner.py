@@ -104,7 +104,9 @@ class AbstractRunner(ABC):
         value : TrialValue
             Contains information about the status/performance of config.
         """
+        # The timestamps are wall-clock times while the runtime is measured with the monotonic performance counter
         start = time.time()
+        start_counter = time.perf_counter()
 
         try:
             status, cost, runtime, additional_info = self.run(
@@ -117,7 +119,7 @@ class AbstractRunner(ABC):
         except Exception as e:
             status = StatusType.CRASHED
             cost = self._crash_cost
-            runtime = time.time() - start
+            runtime = time.perf_counter() - start_counter
 
             # Add context information to the error message
             exception_traceback = traceback.format_exc()
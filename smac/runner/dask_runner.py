@@ -2,12 +2,13 @@ from __future__ import annotations
 
 from typing import Any, Iterator
 
+import asyncio
 import time
 from pathlib import Path
 
 import dask
 from ConfigSpace import Configuration
-from dask.distributed import Client, Future, wait
+from dask.distributed import Client, Future, as_completed
 
 from smac.runhistory import StatusType, TrialInfo, TrialValue
 from smac.runner.abstract_runner import AbstractRunner
@@ -49,11 +50,11 @@ class DaskParallelRunner(AbstractRunner):
     single_worker : AbstractRunner
         A runner to run in a distributed fashion. Will be distributed using `n_workers`.
     patience: int, default to 5
-        How much to wait for workers (seconds) to be available if one fails.
+        How long to wait at most for workers (seconds) to be available if one fails.
     dask_client: Client | None, defaults to None
         User-created dask client, which can be used to start a dask cluster and then attach SMAC to it. This will not
         be closed automatically and will have to be closed manually if provided explicitly. If none is provided
-        (default), a local one will be created for you and closed upon completion.
+        (default), a local one will be created for you and closed by ``close``.
     """
 
     def __init__(
@@ -70,8 +71,9 @@ class DaskParallelRunner(AbstractRunner):
         # The single worker to hold on to and call run on
         self._single_worker = single_worker
 
-        # The list of futures that dask will use to indicate in progress runs
-        self._pending_trials: list[Future] = []
+        # The single worker is sent to the dask workers only once (see ``_get_scattered_single_worker``) so that it is
+        # not pickled again with every submitted trial
+        self._scattered_single_worker: Future | None = None
 
         # Dask related variables
         self._scheduler_file: Path | None = None
@@ -82,13 +84,15 @@ class DaskParallelRunner(AbstractRunner):
 
         if dask_client is None:
             dask.config.set({"distributed.worker.daemon": False})
-            self._close_client_at_del = True
             self._client = Client(
                 n_workers=self._scenario.n_workers,
                 processes=True,
                 threads_per_worker=1,
                 local_directory=str(self._scenario.output_directory),
+                # Results are fetched from the workers directly instead of being routed through the scheduler
+                direct_to_workers=True,
             )
+            self._close_client_at_del = True
 
             if self._scenario.output_directory is not None:
                 self._scheduler_file = Path(self._scenario.output_directory, ".dask_scheduler_file")
@@ -98,6 +102,15 @@ class DaskParallelRunner(AbstractRunner):
             self._client = dask_client
             self._close_client_at_del = False
 
+        # The futures that dask will use to indicate in progress runs. ``as_completed`` queues them up as soon as they
+        # are finished, so that we don't have to poll every pending future to find the completed ones
+        self._pending_trials = as_completed(loop=self._client.loop)
+
+        # Asking for the number of threads is a round-trip to the scheduler. Since the cluster size rarely changes,
+        # we only refresh the number after a second (see ``_count_threads``)
+        self._n_threads = 0
+        self._n_threads_updated_at: float | None = None
+
     def submit_trial(self, trial_info: TrialInfo, **dask_data_to_scatter: dict[str, Any]) -> None:
         """This function submits a configuration embedded in a ``trial_info`` object, and uses one of
         the workers to produce a result locally to each worker.
@@ -127,22 +140,33 @@ class DaskParallelRunner(AbstractRunner):
         # Check for resources or block till one is available
         if self.count_available_workers() <= 0:
             logger.debug("No worker available. Waiting for one to be available...")
-            wait(self._pending_trials, return_when="FIRST_COMPLETED")
+            self.wait()
             self._process_pending_trials()
 
         # Check again to make sure that there are resources
         if self.count_available_workers() <= 0:
             logger.warning("No workers are available. This could mean workers crashed. Waiting for new workers...")
-            time.sleep(self._patience)
-            if self.count_available_workers() <= 0:
+            try:
+                # Returns as soon as a new worker joined instead of always sleeping for the full patience
+                self._client.wait_for_workers(n_workers=len(self._client.nthreads()) + 1, timeout=self._patience)
+            except (TimeoutError, asyncio.TimeoutError):
+                pass
+
+            if self._count_threads(refresh=True) - self._pending_trials.count() <= 0:
                 raise RuntimeError(
                     "Tried to execute a job, but no worker was ever available."
                     "This likely means that a worker crashed or no workers were properly configured."
                 )
 
         # At this point we can submit the job
-        trial = self._client.submit(self._single_worker.run_wrapper, trial_info=trial_info, **dask_data_to_scatter)
-        self._pending_trials.append(trial)
+        trial = self._client.submit(
+            _run_wrapper,
+            self._get_scattered_single_worker(),
+            trial_info=trial_info,
+            pure=False,
+            **dask_data_to_scatter,
+        )
+        self._pending_trials.add(trial)
 
     def iter_results(self) -> Iterator[tuple[TrialInfo, TrialValue]]:  # noqa: D102
         self._process_pending_trials()
@@ -151,10 +175,12 @@ class DaskParallelRunner(AbstractRunner):
 
     def wait(self) -> None:  # noqa: D102
         if self.is_running():
-            wait(self._pending_trials, return_when="FIRST_COMPLETED")
+            # Blocks until the next trial is finished and directly moves it to the results queue
+            trial = next(self._pending_trials)
+            self._results_queue.append(trial.result())
 
     def is_running(self) -> bool:  # noqa: D102
-        return len(self._pending_trials) > 0
+        return not self._pending_trials.is_empty()
 
     def run(
         self,
@@ -170,14 +196,54 @@ class DaskParallelRunner(AbstractRunner):
 
     def count_available_workers(self) -> int:
         """Total number of workers available. This number is dynamic as more resources
-        can be allocated.
+        can be allocated. Changes of the cluster size are picked up within a second.
         """
-        return sum(self._client.nthreads().values()) - len(self._pending_trials)
+        return self._count_threads() - self._pending_trials.count()
 
     def close(self, force: bool = False) -> None:
-        """Closes the client."""
-        if self._close_client_at_del or force:
-            self._client.close()
+        """Closes the client if it was created by the dask runner or if ``force`` is set. Closing an already closed
+        client does nothing.
+
+        Note
+        ----
+        The facade does not close the runner since it might still be used after the optimization. Call this method
+        (or use the runner as context manager) once you are done. Otherwise, the client is only closed when the runner
+        gets garbage collected, which might be as late as the interpreter shutdown.
+
+        Parameters
+        ----------
+        force : bool, defaults to False
+            Whether to close a user-provided client as well.
+        """
+        if (self._close_client_at_del or force) and self._client.status not in ("closing", "closed"):
+            # The scattered single worker can not be used with a closed client anymore
+            self._scattered_single_worker = None
+            self._client.close(timeout=5)
+
+    def _get_scattered_single_worker(self) -> Future:
+        """Returns the future of the single worker, which is scattered to the dask workers on the first call. If the
+        scattered data got lost (e.g., because all workers holding it died), the single worker is scattered again.
+        """
+        if self._scattered_single_worker is None or self._scattered_single_worker.status != "finished":
+            self._scattered_single_worker = self._client.scatter(self._single_worker, broadcast=True, hash=False)
+
+        return self._scattered_single_worker
+
+    def _count_threads(self, refresh: bool = False) -> int:
+        """Returns the total number of threads of the dask workers. The number is cached for a second to avoid
+        querying the scheduler every time we submit or collect a trial.
+
+        Parameters
+        ----------
+        refresh : bool, defaults to False
+            Whether to query the scheduler regardless of the age of the cached number.
+        """
+        now = time.monotonic()
+        if refresh or self._n_threads_updated_at is None or now - self._n_threads_updated_at > 1.0:
+            self._n_threads = sum(self._client.nthreads().values())
+            self._n_threads_updated_at = now
+
+        return self._n_threads
 
     def _process_pending_trials(self) -> None:
         """The completed trials are moved from ``self._pending_trials`` to ``self._results_queue``.
@@ -193,14 +259,33 @@ class DaskParallelRunner(AbstractRunner):
             )
 
         # Move the done run from the worker to the results queue
-        done = [trial for trial in self._pending_trials if trial.done()]
-        for trial in done:
+        while self._pending_trials.has_ready():
+            trial = next(self._pending_trials)
             self._results_queue.append(trial.result())
-            self._pending_trials.remove(trial)
+
+    def __enter__(self) -> DaskParallelRunner:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
 
     def __del__(self) -> None:
         """Makes sure that when this object gets deleted, the client is terminated. This
         is only done if the client was created by the dask runner.
         """
-        if self._close_client_at_del:
+        # During interpreter shutdown, the event loop of the client might already be closed. Closing the client
+        # would hang or raise then. Call ``close`` explicitly (or use the runner as context manager) to shut down
+        # deterministically. If creating the client failed, there is nothing to close.
+        if getattr(self, "_close_client_at_del", False) and not self._client.loop.asyncio_loop.is_closed():
             self.close()
+
+
+def _run_wrapper(
+    single_worker: AbstractRunner,
+    trial_info: TrialInfo,
+    **dask_data_to_scatter: dict[str, Any],
+) -> tuple[TrialInfo, TrialValue]:
+    """Calls ``run_wrapper`` of the single worker. Used as dask task so that the single worker can be passed as
+    scattered data instead of being part of the task itself.
+    """
+    return single_worker.run_wrapper(trial_info, **dask_data_to_scatter)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any, Callable
 
 import copy
+import hashlib
 import inspect
 import math
 import time
@@ -73,6 +74,11 @@ class TargetFunctionRunner(AbstractSerialRunner):
             if key not in required_arguments:
                 logger.warning(f"The argument {key} is not set by SMAC: Consider removing it from the target function.")
 
+        # Whether the trial arguments are passed to the target function in ``run``
+        self._pass_seed = "seed" in required_arguments
+        self._pass_instance = "instance" in required_arguments
+        self._pass_budget = "budget" in required_arguments
+
         # Pynisher limitations
         if (memory := self._scenario.trial_memory_limit) is not None:
             unit = None
@@ -88,6 +94,10 @@ class TargetFunctionRunner(AbstractSerialRunner):
         self._memory_limit = memory
         self._algorithm_walltime_limit = time
 
+        # The crash cost as it is returned from ``run`` (either a float or a list of floats). We only normalize it once
+        # since crashing target functions would otherwise pay for it in every trial.
+        self._normalized_crash_cost: float | list[float] = np.asarray(self._crash_cost).squeeze().tolist()
+
     @property
     def meta(self) -> dict[str, Any]:  # noqa: D102
         meta = super().meta
@@ -95,13 +105,15 @@ class TargetFunctionRunner(AbstractSerialRunner):
         # Partial's don't have a __code__ attribute but are a convenient
         # way a user might want to pass a function to SMAC, specifying
         # keyword arguments.
+        # We only store a digest of the bytecode: It is enough to detect a changed target function but keeps the
+        # scenario meta data (which is hashed, compared and saved) small.
         f = self._target_function
         if isinstance(f, partial):
             f = f.func
-            meta.update({"code": str(f.__code__.co_code)})
+            meta.update({"code": hashlib.md5(f.__code__.co_code).hexdigest()})
             meta.update({"code-partial-args": repr(f)})
         else:
-            meta.update({"code": str(self._target_function.__code__.co_code)})
+            meta.update({"code": hashlib.md5(self._target_function.__code__.co_code).hexdigest()})
 
         return meta
 
@@ -147,16 +159,15 @@ class TargetFunctionRunner(AbstractSerialRunner):
             All further additional trial information.
         """
         # The kwargs are passed to the target function.
-        kwargs: dict[str, Any] = {}
-        kwargs.update(dask_data_to_scatter)
+        kwargs: dict[str, Any] = dict(dask_data_to_scatter)
 
-        if "seed" in self._required_arguments:
+        if self._pass_seed:
             kwargs["seed"] = seed
 
-        if "instance" in self._required_arguments:
+        if self._pass_instance:
             kwargs["instance"] = instance
 
-        if "budget" in self._required_arguments:
+        if self._pass_budget:
             kwargs["budget"] = budget
 
         # Presetting
@@ -165,7 +176,10 @@ class TargetFunctionRunner(AbstractSerialRunner):
         additional_info = {}
         status = StatusType.CRASHED
 
-        # If memory limit or walltime limit is set, we wanna use pynisher
+        # If memory limit or walltime limit is set, we wanna use pynisher.
+        # Note: The wrapper is created per call on purpose. Creating it is cheap compared to the subprocess it spawns,
+        # but it keeps a handle to that subprocess, which can not be pickled (the runner is sent to dask workers) and
+        # must not be shared by the threads of a dask worker.
         target_function: Callable
         if self._memory_limit is not None or self._algorithm_walltime_limit is not None:
             target_function = limit(
@@ -182,37 +196,41 @@ class TargetFunctionRunner(AbstractSerialRunner):
 
         # Call target function
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
             rval = self(config_copy, target_function, kwargs)
-            runtime = time.time() - start_time
+            runtime = time.perf_counter() - start_time
             status = StatusType.SUCCESS
         except WallTimeoutException:
             status = StatusType.TIMEOUT
         except MemoryLimitException:
             status = StatusType.MEMORYOUT
         except Exception as e:
-            cost = np.asarray(cost).squeeze().tolist()
+            cost = self._normalized_crash_cost
             additional_info = {
                 "traceback": traceback.format_exc(),
                 "error": repr(e),
             }
             status = StatusType.CRASHED
 
-        if status != StatusType.SUCCESS:
+        if status is not StatusType.SUCCESS:
             return status, cost, runtime, additional_info
 
+        # Fast path for the most common case: A single objective and a plain float without additional info
+        if type(rval) is float and self._n_objectives == 1:
+            return status, rval, runtime, additional_info
+
         if isinstance(rval, tuple):
             result, additional_info = rval
         else:
             result, additional_info = rval, {}
 
         # Do some sanity checking (for multi objective)
-        error = f"Returned costs {result} does not match the number of objectives {self._objectives}."
-
         # If dict convert to array and make sure the order is correct
         if isinstance(result, dict):
-            if len(result) != len(self._objectives):
-                raise RuntimeError(error)
+            if len(result) != self._n_objectives:
+                raise RuntimeError(
+                    f"Returned costs {result} does not match the number of objectives {self._objectives}."
+                )
 
             ordered_cost: list[float] = []
             for name in self._objectives:
@@ -224,21 +242,29 @@ class TargetFunctionRunner(AbstractSerialRunner):
             result = ordered_cost
 
         if isinstance(result, list):
-            if len(result) != len(self._objectives):
-                raise RuntimeError(error)
+            if len(result) != self._n_objectives:
+                raise RuntimeError(
+                    f"Returned costs {result} does not match the number of objectives {self._objectives}."
+                )
 
         if isinstance(result, float):
-            if isinstance(self._objectives, list) and len(self._objectives) != 1:
-                raise RuntimeError(error)
+            if self._n_objectives != 1:
+                raise RuntimeError(
+                    f"Returned costs {result} does not match the number of objectives {self._objectives}."
+                )
 
         cost = result
 
         if cost is None:
             status = StatusType.CRASHED
-            cost = self.crash_cost
+            cost = self._normalized_crash_cost
 
-        # We want to get either a float or a list of floats.
-        cost = np.asarray(cost).squeeze().tolist()
+        # We want to get either a float or a list of floats. Floats (including numpy floats) don't need the round-trip
+        # through numpy, which is the common case for single-objective target functions.
+        if isinstance(cost, float):
+            cost = float(cost)
+        else:
+            cost = np.asarray(cost).squeeze().tolist()
 
         return status, cost, runtime, additional_info
 
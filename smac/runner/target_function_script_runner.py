@@ -138,9 +138,9 @@ class TargetFunctionScriptRunner(AbstractSerialRunner):
             kwargs[k] = v
 
         # Call target function
-        start_time = time.time()
+        start_time = time.perf_counter()
         output, error = self(kwargs)
-        runtime = time.time() - start_time
+        runtime = time.perf_counter() - start_time
 
         # Now we have to parse the std output
         # First remove white-spaces
@@ -53,7 +53,7 @@ def get_types(
     The bounds for the instance features are *not* added in this function.
     """
     # Extract types vector for rf from config space and the bounds
-    types = [0] * len(configspace.get_hyperparameters())
+    types = [0] * len(configspace)
     bounds = [(np.nan, np.nan)] * len(types)
 
     for i, param in enumerate(configspace.get_hyperparameters()):
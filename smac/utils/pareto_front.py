@@ -68,6 +68,30 @@ def calculate_pareto_front(
     """
     costs = _get_costs(runhistory, configs, config_instance_seed_budget_keys)
 
+    # Two objectives are the most common multi-objective setting, for which a sort-based approach is much faster
+    if costs.shape[1] == 2 and not np.isnan(costs).any():
+        is_efficient = _get_pareto_front_indices_2d(costs)
+    else:
+        is_efficient = _get_pareto_front_indices(costs)
+
+    new_incumbents = [configs[i] for i in is_efficient]
+    return new_incumbents
+
+
+def _get_pareto_front_indices(costs: np.ndarray) -> np.ndarray:
+    """Returns the indices of the points on the pareto front. If points have the same costs, only the first one
+    is kept.
+
+    Parameters
+    ----------
+    costs : np.ndarray[n_points, n_objectives]
+        Costs of the points.
+
+    Returns
+    -------
+    indices : np.ndarray
+        Indices of the points on the pareto front in ascending order.
+    """
     # The following code is an efficient pareto front implementation
     is_efficient = np.arange(costs.shape[0])
     next_point_index = 0  # Next index in the is_efficient array to search for
@@ -78,8 +102,39 @@ def calculate_pareto_front(
         costs = costs[nondominated_point_mask]
         next_point_index = np.sum(nondominated_point_mask[:next_point_index]) + 1
 
-    new_incumbents = [configs[i] for i in is_efficient]
-    return new_incumbents
+    return is_efficient
+
+
+def _get_pareto_front_indices_2d(costs: np.ndarray) -> np.ndarray:
+    """Returns the same indices as ``_get_pareto_front_indices`` but only works for two objectives (without NaNs).
+    After sorting the points by the first and then by the second objective, a point is on the pareto front iff its
+    second objective is strictly lower than the ones of all points before it. This needs O(n log n) instead of
+    O(n^2) time.
+
+    Parameters
+    ----------
+    costs : np.ndarray[n_points, 2]
+        Costs of the points.
+
+    Returns
+    -------
+    indices : np.ndarray
+        Indices of the points on the pareto front in ascending order.
+    """
+    if len(costs) == 0:
+        return np.arange(0)
+
+    # The sort is stable, so that the first of multiple points with the same costs comes first
+    order = np.lexsort((costs[:, 1], costs[:, 0]))
+    second = costs[order, 1]
+
+    # The first point is never dominated, even if its costs are infinite
+    previous_min = np.minimum.accumulate(second)
+    is_efficient = np.empty(len(second), dtype=bool)
+    is_efficient[0] = True
+    is_efficient[1:] = second[1:] < previous_min[:-1]
+
+    return np.sort(order[is_efficient])
 
 
 def sort_by_crowding_distance(
@@ -149,7 +204,8 @@ def sort_by_crowding_distance(
 
     # Replace infinity with a large number
     crowding[np.isinf(crowding)] = infinity
-    config_with_crowding = [(config, v) for config, v in zip(configs, crowding)]
-    config_with_crowding = sorted(config_with_crowding, key=lambda x: x[1], reverse=True)
 
-    return [c for c, _ in config_with_crowding]
+    # Sort descending; the stable sort keeps configs with the same crowding distance in their original order
+    order = np.argsort(-crowding, kind="stable")
+
+    return [configs[i] for i in order]
@@ -101,8 +101,8 @@ def test_parallel_runs(make_dummy_ta: Callable[..., TargetFunctionRunner]) -> No
     # At this stage, we submitted 2 jobs, that are running in remote workers.
     # We have to wait for each one of them to complete. The runner provides a
     # wait() method to do so, yet it can only wait for a single job to be completed.
-    # It does internally via dask wait(<list of futures>) so we take wait for the
-    # first job to complete, and take it out
+    # It does internally via dask as_completed: next() blocks until the first job
+    # is completed, and we take it out
     runner.wait()
     first = next(runner.iter_results(), None)
 
@@ -196,3 +196,117 @@ def test_with_external_client(make_dummy_ta: Callable[..., TargetFunctionRunner]
 
     assert client.status == "running"
     client.close()
+
+
+def test_context_manager(make_dummy_ta: Callable[..., TargetFunctionRunner]) -> None:
+    """
+    Expects
+    -------
+    * Leaving the context closes the client created by the runner
+    * Closing the runner a second time does not raise
+    """
+    single_worker = make_dummy_ta(target, n_workers=2)
+    with DaskParallelRunner(single_worker=single_worker) as runner:
+        client = runner._client
+        assert client.status == "running"
+
+    assert client.status == "closed"
+    runner.close()
+
+
+def test_restarted_workers(make_dummy_ta: Callable[..., TargetFunctionRunner]) -> None:
+    """
+    Expects
+    -------
+    * Trials can still be submitted after all workers holding the scattered single worker were restarted
+    """
+    single_worker = make_dummy_ta(target, n_workers=2)
+    with DaskParallelRunner(single_worker=single_worker) as runner:
+        runner.submit_trial(TrialInfo(config=2, instance="test", seed=0, budget=0.0))
+        runner.wait()
+        _, run_value = next(runner.iter_results())
+        assert run_value.status == StatusType.SUCCESS
+
+        runner._client.restart()
+
+        runner.submit_trial(TrialInfo(config=3, instance="test", seed=0, budget=0.0))
+        runner.wait()
+        _, run_value = next(runner.iter_results())
+        assert run_value.status == StatusType.SUCCESS
+        assert run_value.cost == 9
+
+
+def test_count_threads_cached(
+    make_dummy_ta: Callable[..., TargetFunctionRunner],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Expects
+    -------
+    * The number of threads is only queried once within a second
+    * ``refresh=True`` queries the scheduler regardless of the cached number
+    """
+    single_worker = make_dummy_ta(target, n_workers=2)
+    with DaskParallelRunner(single_worker=single_worker) as runner:
+        calls = []
+
+        def nthreads() -> dict[str, int]:
+            calls.append(None)
+            return {"a": 1, "b": 1, "c": 1}
+
+        monkeypatch.setattr(runner._client, "nthreads", nthreads)
+        runner._n_threads_updated_at = None
+
+        assert runner._count_threads() == 3
+        assert runner.count_available_workers() == 3
+        assert len(calls) == 1
+
+        assert runner._count_threads(refresh=True) == 3
+        assert len(calls) == 2
+
+        # Once the cached number is older than a second, it is queried again
+        runner._n_threads_updated_at -= 2
+        assert runner._count_threads() == 3
+        assert len(calls) == 3
+
+
+def test_wait_for_workers(
+    make_dummy_ta: Callable[..., TargetFunctionRunner],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Expects
+    -------
+    * Without any worker, the runner waits for a new one and submits the trial once it joined
+    * If no worker joins within the patience, an error is raised
+    """
+    single_worker = make_dummy_ta(target, n_workers=2)
+    with DaskParallelRunner(single_worker=single_worker, patience=1) as runner:
+        nthreads = runner._client.nthreads
+        joined = []
+
+        def wait_for_workers(n_workers: int, timeout: float) -> None:
+            assert n_workers == 1
+            assert timeout == 1
+            joined.append(None)
+
+        monkeypatch.setattr(runner._client, "nthreads", lambda: nthreads() if joined else {})
+        monkeypatch.setattr(runner._client, "wait_for_workers", wait_for_workers)
+        runner._n_threads_updated_at = None
+
+        runner.submit_trial(TrialInfo(config=2, instance="test", seed=0, budget=0.0))
+        assert len(joined) == 1
+
+        runner.wait()
+        _, run_value = next(runner.iter_results())
+        assert run_value.cost == 4
+
+        def timeout(n_workers: int, timeout: float) -> None:
+            raise TimeoutError
+
+        joined.clear()
+        monkeypatch.setattr(runner._client, "wait_for_workers", timeout)
+        runner._n_threads_updated_at = None
+
+        with pytest.raises(RuntimeError, match="no worker was ever available"):
+            runner.submit_trial(TrialInfo(config=3, instance="test", seed=0, budget=0.0))
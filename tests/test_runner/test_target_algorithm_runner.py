@@ -37,6 +37,11 @@ def target_dummy(config: Configuration, seed: int) -> int:
     return seed
 
 
+def target_none(config: Configuration, seed: int) -> None:
+    """Target function which does not return any cost"""
+    return None
+
+
 def target_multi_objective1(
     config: Configuration,
     seed: int,
@@ -154,6 +159,19 @@ def test_call(make_runner: Callable[..., TargetFunctionRunner]) -> None:
     assert status == StatusType.SUCCESS
 
 
+def test_crash_cost(make_runner: Callable[..., TargetFunctionRunner]) -> None:
+    """Test failing target functions and target functions without a cost get the crash cost"""
+    for use_multi_objective in [False, True]:
+        for target in [target_failed, target_none]:
+            runner = make_runner(target, use_multi_objective=use_multi_objective)
+            config = runner._scenario.configspace.get_default_configuration()
+
+            status, cost, _, _ = runner.run(config=config, instance=None, seed=0, budget=None)
+
+            assert cost == runner._crash_cost
+            assert status == StatusType.CRASHED
+
+
 def test_multi_objective(make_runner: Callable[..., TargetFunctionRunner]) -> None:
     """Test multiobjective function processed properly"""
     # We always expect a list of costs (although a dict is returned).
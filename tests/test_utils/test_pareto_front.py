@@ -1,6 +1,13 @@
+import numpy as np
+
 from smac.runhistory import RunHistory
 from smac.runhistory.dataclasses import InstanceSeedBudgetKey
-from smac.utils.pareto_front import calculate_pareto_front, sort_by_crowding_distance
+from smac.utils.pareto_front import (
+    _get_pareto_front_indices,
+    _get_pareto_front_indices_2d,
+    calculate_pareto_front,
+    sort_by_crowding_distance,
+)
 
 
 def test_pareto_front(configspace_small):
@@ -23,6 +30,20 @@ def test_pareto_front(configspace_small):
     assert len(configs) == 2
 
 
+def test_pareto_front_2d():
+    """Tests whether the sort-based pareto front for two objectives matches the general one."""
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        # Few distinct values to get many duplicates and ties
+        costs = rng.integers(0, 5, size=(rng.integers(1, 30), 2)).astype(float)
+        costs[rng.random(costs.shape) < 0.1] = np.inf
+        assert list(_get_pareto_front_indices_2d(costs)) == list(_get_pareto_front_indices(costs))
+
+    # Duplicates: Only the first point is kept
+    costs = np.array([[1.0, 2.0], [2.0, 1.0], [1.0, 2.0], [3.0, 3.0]])
+    assert list(_get_pareto_front_indices_2d(costs)) == [0, 1]
+
+
 def test_crowding_distance(configspace_small):
     """Tests whether the configs are correctly sorted by the crowding distance."""
     rh = RunHistory()